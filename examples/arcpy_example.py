@@ -5,6 +5,7 @@ including listing feature classes, examining properties, and performing basic ge
 """
 
 import arcpy
+import functools
 import os
 
 # Set workspace to geodatabase
@@ -14,15 +15,111 @@ arcpy.env.workspace = gdb_path
 # Enable overwriting of output datasets
 arcpy.env.overwriteOutput = True
 
+# arcpy.da.Describe dictionaries keyed by dataset path; describing walks the
+# geodatabase catalog on every call, so each dataset is only described once
+_describe_cache = {}
 
-def list_feature_classes():
-    """List all feature classes in the geodatabase."""
+# Feature counts keyed by dataset path
+_count_cache = {}
+
+# ((folder, catalog table) st_mtime_ns, feature class names) from the last listing
+_feature_class_listing = None
+
+
+def _joined_path(fc_name):
+    """
+    Return the full path of a feature class in the geodatabase.
+
+    Not cached: gdb_path may be changed at runtime, and the Describe and
+    count caches are keyed by the full path this returns.
+    """
+    return os.path.join(gdb_path, fc_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _sr(wkid):
+    """Return a cached SpatialReference for a well-known ID."""
+    return arcpy.SpatialReference(wkid)
+
+
+def _desc(path):
+    """Return the cached arcpy.da.Describe dictionary for a dataset path."""
+    if path not in _describe_cache:
+        _describe_cache[path] = arcpy.da.Describe(path)
+    return _describe_cache[path]
+
+
+def _feature_count(path):
+    """
+    Return the cached feature count for a dataset path.
+
+    File geodatabases and shapefiles keep the row count in their metadata, so
+    GetCount is a cheap read there; enterprise geodatabases run a COUNT query,
+    which is why the result is cached. Sources that GetCount cannot handle
+    are counted with a single OID-only cursor pass.
+    """
+    if path not in _count_cache:
+        try:
+            _count_cache[path] = int(arcpy.management.GetCount(path)[0])
+        except arcpy.ExecuteError:
+            try:
+                with arcpy.da.SearchCursor(path, ["OID@"]) as cursor:
+                    _count_cache[path] = sum(1 for _ in cursor)
+            except RuntimeError as e:
+                # Surface cursor failures like GetCount's so callers handle one error type
+                raise arcpy.ExecuteError(str(e))
+    return _count_cache[path]
+
+
+def _invalidate(path):
+    """Drop cached Describe and count results for a dataset that is being rewritten."""
+    _describe_cache.pop(path, None)
+    _count_cache.pop(path, None)
+
+
+def _feature_classes(gdb_stat=None):
+    """
+    Return the names of the feature classes in the geodatabase.
+
+    A file geodatabase is a folder whose modification time changes whenever
+    datasets are added or removed. Renames only rewrite the catalog table
+    (a00000001.gdbtable) in place, so its modification time is checked as
+    well, and the listing is reused until either changes.
+    Enterprise geodatabases (.sde connection files) give no such signal and
+    are listed with one arcpy.da.Walk traversal on every call.
+    """
+    global _feature_class_listing
+    if gdb_path.lower().endswith(".sde"):
+        _, _, names = next(arcpy.da.Walk(gdb_path, datatype="FeatureClass"), (None, None, []))
+        return names
+    
+    folder_mtime = (gdb_stat or os.stat(gdb_path)).st_mtime_ns
+    try:
+        catalog_mtime = os.stat(os.path.join(gdb_path, "a00000001.gdbtable")).st_mtime_ns
+    except OSError:
+        catalog_mtime = None
+    mtimes = (folder_mtime, catalog_mtime)
+    if _feature_class_listing is None or _feature_class_listing[0] != mtimes:
+        _feature_class_listing = (mtimes, arcpy.ListFeatureClasses())
+    return _feature_class_listing[1]
+
+
+def list_feature_classes(gdb_stat=None):
+    """
+    List all feature classes in the geodatabase.
+
+    Pass the os.stat result of the geodatabase if it is already known, so it
+    is not stat'ed again.
+    """
     print("Feature Classes in Geodatabase:")
     print("-" * 40)
     
     try:
-        # List all feature classes
-        feature_classes = arcpy.ListFeatureClasses()
+        # List all feature classes; a missing geodatabase has none
+        try:
+            feature_classes = _feature_classes(gdb_stat)
+        except OSError:
+            feature_classes = []
         
         if feature_classes:
             for fc in feature_classes:
@@ -33,50 +130,79 @@ def list_feature_classes():
         print(f"Error listing feature classes: {e}")
 
 
-def examine_feature_class(fc_name):
-    """Examine properties of a specific feature class."""
+def examine_feature_class(fc_name, include_count=False):
+    """
+    Examine properties of a specific feature class.
+
+    Shape type, spatial reference and fields all come from one cached
+    arcpy.da.Describe call. The feature count is only computed when asked for.
+    Returns a dictionary of the properties, or None on error.
+    """
     print(f"\nFeature Class Properties: {fc_name}")
     print("-" * 40)
     
     try:
-        fc_path = os.path.join(gdb_path, fc_name)
+        fc_path = _joined_path(fc_name)
         
         # Get feature class properties
-        desc = arcpy.Describe(fc_path)
-        print(f"  Shape Type: {desc.shapeType}")
-        print(f"  Feature Count: {arcpy.GetCount_management(fc_path)}")
-        print(f"  Spatial Reference: {desc.spatialReference.name}")
+        desc = _desc(fc_path)
+        properties = {
+            "shape_type": desc["shapeType"],
+            "spatial_reference": desc["spatialReference"].name,
+            "fields": [(field.name, field.type) for field in desc["fields"]],
+        }
+        print(f"  Shape Type: {properties['shape_type']}")
+        if include_count:
+            properties["count"] = _feature_count(fc_path)
+            print(f"  Feature Count: {properties['count']}")
+        print(f"  Spatial Reference: {properties['spatial_reference']}")
         
         # List fields
         print(f"\n  Fields:")
-        fields = arcpy.ListFields(fc_path)
-        for field in fields:
-            print(f"    - {field.name}: {field.type}")
-            
+        for name, field_type in properties["fields"]:
+            print(f"    - {name}: {field_type}")
+        
+        return properties
     except arcpy.ExecuteError as e:
         print(f"Error examining feature class: {e}")
+        return None
 
 
-def create_feature_class(fc_name, shape_type="POINT"):
-    """Create a new feature class in the geodatabase."""
+def create_feature_class(fc_name, shape_type="POINT", template=None, default_sr_wkid=4326):
+    """
+    Create a new feature class in the geodatabase.
+
+    The sample fields are added with a single AddFields schema edit. If a
+    template feature class is given, its schema is copied at creation time
+    instead and no fields are added afterwards. The spatial reference
+    defaults to WGS84 (WKID 4326) and is built once per WKID.
+    """
     print(f"\nCreating Feature Class: {fc_name}")
     print("-" * 40)
     
     try:
         # Create feature class
-        fc_path = os.path.join(gdb_path, fc_name)
+        fc_path = _joined_path(fc_name)
+        _invalidate(fc_path)
         arcpy.CreateFeatureclass_management(
             out_path=gdb_path,
             out_name=fc_name,
             geometry_type=shape_type,
-            spatial_reference=arcpy.SpatialReference(4326)  # WGS84
+            template=_joined_path(template) if template else None,
+            spatial_reference=_sr(default_sr_wkid)
         )
         print(f"  Successfully created: {fc_name}")
         
-        # Add some sample fields
-        arcpy.AddField_management(fc_path, "NAME", "TEXT", field_length=100)
-        arcpy.AddField_management(fc_path, "DESCRIPTION", "TEXT", field_length=255)
-        arcpy.AddField_management(fc_path, "DATE_CREATED", "DATE")
+        if template:
+            print(f"  Copied schema from {template}")
+            return
+        
+        # Add some sample fields: [name, type, alias, length]
+        arcpy.management.AddFields(fc_path, [
+            ["NAME", "TEXT", "", 100],
+            ["DESCRIPTION", "TEXT", "", 255],
+            ["DATE_CREATED", "DATE"],
+        ])
         print(f"  Added sample fields to {fc_name}")
         
     except arcpy.ExecuteError as e:
@@ -89,8 +215,9 @@ def buffer_feature_class(input_fc, output_fc, buffer_distance):
     print("-" * 40)
     
     try:
-        input_path = os.path.join(gdb_path, input_fc)
-        output_path = os.path.join(gdb_path, output_fc)
+        input_path = _joined_path(input_fc)
+        output_path = _joined_path(output_fc)
+        _invalidate(output_path)
         
         # Perform buffer operation
         arcpy.Buffer_analysis(
@@ -113,9 +240,10 @@ def spatial_join(target_fc, join_fc, output_fc, join_operation="JOIN_ONE_TO_ONE"
     print("-" * 40)
     
     try:
-        target_path = os.path.join(gdb_path, target_fc)
-        join_path = os.path.join(gdb_path, join_fc)
-        output_path = os.path.join(gdb_path, output_fc)
+        target_path = _joined_path(target_fc)
+        join_path = _joined_path(join_fc)
+        output_path = _joined_path(output_fc)
+        _invalidate(output_path)
         
         # Perform spatial join
         arcpy.SpatialJoin_analysis(
@@ -138,18 +266,20 @@ def main():
     print("=" * 40)
     
     # Check if geodatabase exists
-    if not os.path.exists(gdb_path):
+    try:
+        gdb_stat = os.stat(gdb_path)
+    except FileNotFoundError:
         print(f"Error: Geodatabase not found at {gdb_path}")
         print("Please update the gdb_path variable to point to your geodatabase.")
         return
     
     # List feature classes
-    list_feature_classes()
+    list_feature_classes(gdb_stat)
     
     # Examine a specific feature class (if it exists)
-    feature_classes = arcpy.ListFeatureClasses()
+    feature_classes = _feature_classes(gdb_stat)
     if feature_classes:
-        examine_feature_class(feature_classes[0])
+        examine_feature_class(feature_classes[0], include_count=True)
     
     # Example: Create a new feature class (uncomment to use)
     # create_feature_class("sample_points", "POINT")
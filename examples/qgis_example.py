@@ -9,7 +9,8 @@ This module demonstrates common PyQGIS operations including:
 - Layer filtering and selection
 - Attribute manipulation
 
-Requires QGIS Python bindings to be installed.
+Requires QGIS Python bindings to be installed. NumPy and the GDAL bindings
+(both shipped with QGIS) are only imported by the methods that use them.
 """
 
 from qgis.core import (
@@ -24,13 +25,120 @@ from qgis.core import (
     QgsFields,
     QgsField,
     QgsVectorFileWriter,
+    QgsFeatureRequest,
+    QgsExpression,
+    QgsExpressionContext,
+    QgsExpressionContextScope,
+    QgsExpressionContextUtils,
+    QgsSpatialIndex,
+    QgsProviderRegistry,
+    QgsRectangle,
+    QgsVectorLayerFeatureSource,
+    NULL,
 )
-from qgis.gui import QgsLayerTreeView
 from PyQt5.QtCore import QVariant
+from concurrent.futures import ThreadPoolExecutor
+import collections
+import copy
+import functools
 import os
 import sys
 
 
+# Layer bounding box returned by QGISProjectManager.get_layer_extent
+Extent = collections.namedtuple("Extent", "xmin ymin xmax ymax")
+
+# NumPy dtypes for numeric QGIS field types; other field types use object arrays
+_NUMPY_DTYPES = {
+    QVariant.Bool: "bool",
+    QVariant.Int: "int32",
+    QVariant.UInt: "uint32",
+    QVariant.LongLong: "int64",
+    QVariant.ULongLong: "uint64",
+    QVariant.Double: "float64",
+}
+
+# OGR layer creation options applied by export_vector_layer, keyed by driver name
+_EXPORT_LAYER_OPTIONS = {
+    "ESRI Shapefile": ["SPATIAL_INDEX=YES"],
+    "GPKG": ["FID=fid", "SPATIAL_INDEX=YES"],
+    "FlatGeobuf": ["SPATIAL_INDEX=YES"],
+    "Parquet": ["GEOMETRY_ENCODING=WKB"],
+}
+
+# Providers that cannot use an attribute index for filter expressions; equality
+# filters on these run against a cached NumPy copy of the column instead
+_UNINDEXED_PROVIDERS = ("memory", "delimitedtext")
+
+# OGR-backed layers with at least this many features are exported by GDAL directly
+_GDAL_EXPORT_THRESHOLD = 100000
+
+# QgsApplication created by _ensure_qgis, if any
+_qgs_app = None
+
+
+def _ensure_qgis(prefix_path=None):
+    """
+    Initialize QGIS for standalone scripts.
+
+    Does nothing if a QgsApplication already exists (e.g. inside the QGIS
+    Python console), so it is safe to call more than once.
+
+    Args:
+        prefix_path (str): QGIS install prefix. Falls back to the QGIS_PREFIX_PATH
+            environment variable handled by QgsApplication itself.
+
+    Returns:
+        QgsApplication: The running application
+    """
+    global _qgs_app
+    app = QgsApplication.instance()
+    if app is None:
+        if prefix_path:
+            QgsApplication.setPrefixPath(prefix_path, True)
+        app = QgsApplication([], False)
+        app.initQgis()
+        # Keep a reference so the application is not garbage collected
+        _qgs_app = app
+    return app
+
+
+def _requires_vector_layer(default=None):
+    """
+    Resolve the layer name argument of a QGISProjectManager method.
+
+    The decorated method is called with the QgsVectorLayer in place of the
+    layer name. If the layer does not exist or is not a vector layer, the
+    method is skipped and a copy of default is returned.
+
+    Args:
+        default: Value returned when no vector layer is found
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, layer_name, *args, **kwargs):
+            layer = self.get_layer_by_name(layer_name)
+            if not isinstance(layer, QgsVectorLayer):
+                print("Invalid layer or not a vector layer")
+                return copy.copy(default)
+            return method(self, layer, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _prepared_engine(geometry):
+    """
+    Create a GEOS engine for a geometry with its prepared form built.
+
+    Preparing indexes the geometry once, so repeated predicate tests against
+    many candidates are much cheaper than QgsGeometry.intersects() and friends.
+    The geometry must stay referenced while the engine is in use.
+    """
+    engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+    engine.prepareGeometry()
+    return engine
+
+
 class QGISProjectManager:
     """Manages QGIS projects and layer operations."""
 
@@ -43,6 +151,13 @@ class QGISProjectManager:
         """
         self.project = QgsProject.instance()
         self.project_path = project_path
+        self._name_index = {}
+        self._attr_cache = {}
+        self._extent_cache = {}
+        self._watched_layers = set()
+        self.project.layersAdded.connect(self._invalidate_name_index)
+        self.project.layersWillBeRemoved.connect(self._invalidate_name_index)
+        self.project.layersWillBeRemoved.connect(self._forget_layers)
         if project_path and os.path.exists(project_path):
             self.load_project(project_path)
 
@@ -148,42 +263,68 @@ class QGISProjectManager:
             print(f"Error adding raster layer: {e}")
             return None
 
-    def list_layers(self):
+    def iter_layers(self):
+        """
+        Iterate over all layers in the project.
+
+        Yields:
+            tuple: (layer ID, layer) pairs
+        """
+        yield from self.project.mapLayers().items()
+
+    def list_layers(self, verbose=False):
         """
         List all layers in the project.
 
+        Args:
+            verbose (bool): True to include each layer's CRS and print a summary line per layer
+
         Returns:
             list: List of layer information dictionaries
         """
         layers_info = []
-        for layer_id, layer in self.project.mapLayers().items():
+        for layer_id, layer in self.iter_layers():
             layer_info = {
                 "id": layer_id,
                 "name": layer.name(),
                 "type": layer.type(),
                 "valid": layer.isValid(),
-                "crs": layer.crs().authid() if layer.crs() else "Unknown",
             }
+            if verbose:
+                crs = layer.crs()
+                layer_info["crs"] = crs.authid() if crs.isValid() else "Unknown"
+                print(f"Layer: {layer_info['name']} ({layer_info['type']}) - CRS: {layer_info['crs']}")
             layers_info.append(layer_info)
-            print(f"Layer: {layer.name()} ({layer.type()}) - CRS: {layer_info['crs']}")
 
         return layers_info
 
+    def _invalidate_name_index(self, *args):
+        """Drop the cached layer name lookup after layers are added or removed."""
+        self._name_index.clear()
+
     def get_layer_by_name(self, layer_name):
         """
         Get a layer by its name.
 
+        Lookups go through a name -> layer dict that is rebuilt from the
+        project when a name is missing or a cached layer has been renamed.
+
         Args:
             layer_name (str): Name of the layer
 
         Returns:
             QgsLayer: The layer or None if not found
         """
-        for layer in self.project.mapLayers().values():
-            if layer.name() == layer_name:
-                return layer
-        print(f"Layer not found: {layer_name}")
-        return None
+        layer = self._name_index.get(layer_name)
+        if layer is None or layer.name() != layer_name:
+            self._name_index.clear()
+            for project_layer in self.project.mapLayers().values():
+                self._name_index.setdefault(project_layer.name(), project_layer)
+            layer = self._name_index.get(layer_name)
+
+        if layer is None:
+            print(f"Layer not found: {layer_name}")
+        return layer
 
     def remove_layer(self, layer_name):
         """
@@ -206,36 +347,217 @@ class QGISProjectManager:
             print(f"Error removing layer: {e}")
             return False
 
-    def get_layer_features(self, layer_name, limit=None):
+    @_requires_vector_layer([])
+    def get_layer_features(self, layer, limit=None, attributes_only=False, workers=1):
         """
         Get features from a vector layer.
 
         Args:
             layer_name (str): Name of the vector layer
             limit (int): Maximum number of features to retrieve
+            attributes_only (bool): True to skip fetching feature geometries
+            workers (int): Number of threads reading features (e.g. os.cpu_count()).
+                Ignored when limit is set.
 
         Returns:
             list: List of features
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:  # 0 = Vector layer
-                print("Invalid layer or not a vector layer")
-                return []
-
-            features = []
-            for i, feature in enumerate(layer.getFeatures()):
-                if limit and i >= limit:
-                    break
-                features.append(feature)
+            request = QgsFeatureRequest()
+            if limit:
+                request.setLimit(limit)
+            if attributes_only:
+                request.setFlags(QgsFeatureRequest.NoGeometry)
+
+            if workers > 1 and not limit:
+                features = self._get_features_parallel(layer, request, workers)
+            else:
+                features = list(layer.getFeatures(request))
 
-            print(f"Retrieved {len(features)} features from {layer_name}")
+            print(f"Retrieved {len(features)} features from {layer.name()}")
             return features
         except Exception as e:
             print(f"Error retrieving features: {e}")
             return []
 
-    def get_layer_attributes(self, layer_name):
+    def _get_features_parallel(self, layer, request, workers):
+        """
+        Read features in threads, one contiguous range of feature IDs per thread.
+
+        QgsVectorLayer itself is not thread safe, so every worker reads from its
+        own QgsVectorLayerFeatureSource created on the calling thread. This pays
+        off for providers that release the GIL while reading, such as
+        GeoPackage and PostGIS.
+
+        Args:
+            layer (QgsVectorLayer): The vector layer
+            request (QgsFeatureRequest): Request applied to every chunk
+            workers (int): Number of threads
+
+        Returns:
+            list: Features in feature ID order
+        """
+        id_request = QgsFeatureRequest().setNoAttributes().setFlags(QgsFeatureRequest.NoGeometry)
+        fids = sorted(feature.id() for feature in layer.getFeatures(id_request))
+        if not fids:
+            return []
+
+        chunk_size = -(-len(fids) // workers)
+        chunks = [fids[i:i + chunk_size] for i in range(0, len(fids), chunk_size)]
+        sources = [QgsVectorLayerFeatureSource(layer) for _ in chunks]
+
+        def read_chunk(source, chunk):
+            chunk_request = QgsFeatureRequest(request).setFilterFids(chunk)
+            return sorted(source.getFeatures(chunk_request), key=lambda feature: feature.id())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(read_chunk, sources, chunks)
+            return [feature for chunk_features in results for feature in chunk_features]
+
+    @_requires_vector_layer(None)
+    def get_attribute_array(self, layer, field_name):
+        """
+        Get the values of one attribute field as a NumPy array.
+
+        The array dtype follows the field type (numeric fields get a numeric
+        dtype, anything else an object array). NULL values become NaN, which
+        promotes integer and boolean arrays to float64.
+
+        Args:
+            layer_name (str): Name of the vector layer
+            field_name (str): Attribute field name
+
+        Returns:
+            numpy.ndarray: Field values in feature iteration order, or None if failed
+        """
+        try:
+            fields = layer.fields()
+            field_index = fields.indexOf(field_name)
+            if field_index == -1:
+                print(f"Field not found: {field_name}")
+                return None
+
+            _, values = self._read_attribute(layer, field_index)
+            return values
+        except Exception as e:
+            print(f"Error retrieving attribute array: {e}")
+            return None
+
+    def _read_attribute(self, layer, field_index):
+        """
+        Read one attribute column of a vector layer into NumPy arrays.
+
+        Args:
+            layer (QgsVectorLayer): The vector layer
+            field_index (int): Index of the attribute field
+
+        Returns:
+            tuple: (feature IDs, field values) arrays in feature iteration order
+        """
+        import numpy as np
+
+        dtype = _NUMPY_DTYPES.get(layer.fields().at(field_index).type(), object)
+        size = max(layer.featureCount(), 0)
+        fids = np.empty(size, dtype=np.int64)
+        values = np.empty(size, dtype=dtype)
+
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([field_index])
+
+        count = 0
+        for feature in layer.getFeatures(request):
+            # featureCount() can be an estimate, so grow if it was too low
+            if count == len(values):
+                fids = np.resize(fids, max(1, 2 * count))
+                values = np.resize(values, max(1, 2 * count))
+
+            value = feature.attribute(field_index)
+            if value is None or value == NULL:
+                if values.dtype == object:
+                    value = None
+                else:
+                    if values.dtype != np.float64:
+                        values = values.astype(np.float64)
+                    value = np.nan
+            fids[count] = feature.id()
+            values[count] = value
+            count += 1
+
+        return fids[:count], values[:count]
+
+    def _cached_attribute(self, layer, field_name):
+        """
+        Get the cached (feature IDs, values) arrays for a layer field.
+
+        Entries for a layer are dropped whenever its data changes or an edit
+        session ends or its fields are updated, and rebuilt if the layer's
+        feature count no longer matches. Entries are keyed by field name, so
+        adding or removing other fields cannot shift them. Edits made directly through the data provider (common for
+        memory layers) emit neither signal, so call invalidate_layer_cache()
+        after changing attribute values that way.
+
+        Args:
+            layer (QgsVectorLayer): The vector layer
+            field_name (str): Attribute field name
+
+        Returns:
+            tuple: (feature IDs, field values) arrays
+        """
+        key = (layer.id(), field_name)
+        feature_count = layer.featureCount()
+        cached = self._attr_cache.get(key)
+        if cached is None or cached[0] != feature_count:
+            self._watch_layer(layer)
+            fids, values = self._read_attribute(layer, layer.fields().indexOf(field_name))
+            cached = self._attr_cache[key] = (feature_count, fids, values)
+        return cached[1], cached[2]
+
+    def invalidate_layer_cache(self, layer_name):
+        """
+        Drop cached attribute columns and extent of a layer.
+
+        Needed after editing a layer through its data provider, e.g.
+        layer.dataProvider().changeAttributeValues(), which bypasses the
+        signals the caches listen to.
+
+        Args:
+            layer_name (str): Name of the layer
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        layer = self.get_layer_by_name(layer_name)
+        if not layer:
+            return False
+        self._invalidate_layer_caches(layer.id())
+        return True
+
+    def _watch_layer(self, layer):
+        """Invalidate the cached data of a layer when its data or fields change or an edit session ends."""
+        layer_id = layer.id()
+        if layer_id in self._watched_layers:
+            return
+        layer.dataChanged.connect(lambda: self._invalidate_layer_caches(layer_id))
+        if isinstance(layer, QgsVectorLayer):
+            layer.editingStopped.connect(lambda: self._invalidate_layer_caches(layer_id))
+            layer.updatedFields.connect(lambda: self._invalidate_layer_caches(layer_id))
+        self._watched_layers.add(layer_id)
+
+    def _forget_layers(self, layer_ids):
+        """Drop cached data and signal bookkeeping of layers leaving the project."""
+        for layer_id in layer_ids:
+            self._invalidate_layer_caches(layer_id)
+            self._watched_layers.discard(layer_id)
+
+    def _invalidate_layer_caches(self, layer_id):
+        """Drop cached attribute columns and extent of a layer."""
+        for key in [key for key in self._attr_cache if key[0] == layer_id]:
+            del self._attr_cache[key]
+        self._extent_cache.pop(layer_id, None)
+
+    @_requires_vector_layer([])
+    def get_layer_attributes(self, layer):
         """
         Get attribute field names from a vector layer.
 
@@ -246,11 +568,6 @@ class QGISProjectManager:
             list: List of attribute field names
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:
-                print("Invalid layer or not a vector layer")
-                return []
-
             fields = [field.name() for field in layer.fields()]
             print(f"Layer attributes: {fields}")
             return fields
@@ -258,28 +575,66 @@ class QGISProjectManager:
             print(f"Error retrieving attributes: {e}")
             return []
 
-    def filter_features(self, layer_name, attribute, value):
+    @_requires_vector_layer([])
+    def filter_features(self, layer, attribute, value, attributes=None, with_geometry=True):
         """
         Filter features by attribute value.
 
+        The equality test is passed to the data provider as a filter
+        expression, so OGR/PostGIS/GeoPackage sources evaluate it natively
+        instead of every feature being compared in Python. Providers that
+        cannot index attributes (memory, delimited text) are matched against
+        a cached NumPy copy of the column and fetched by feature ID; see
+        invalidate_layer_cache() for edits made through the data provider.
+
         Args:
             layer_name (str): Name of the vector layer
             attribute (str): Attribute field name
             value: Value to filter by
+            attributes (list): Field names to fetch. Fetches all fields if not provided.
+            with_geometry (bool): False to skip fetching feature geometries
 
         Returns:
             list: List of matching features
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:
-                print("Invalid layer or not a vector layer")
-                return []
-
-            matching_features = []
-            for feature in layer.getFeatures():
-                if feature.attribute(attribute) == value:
-                    matching_features.append(feature)
+            request = QgsFeatureRequest()
+            field_index = layer.fields().indexOf(attribute)
+            # NULL never equals anything, so null lookups need an IS NULL test
+            is_null = value is None or value == NULL
+            if (
+                layer.providerType() in _UNINDEXED_PROVIDERS
+                and field_index != -1
+                and not is_null
+            ):
+                import numpy as np
+
+                fids, values = self._cached_attribute(layer, attribute)
+                mask = values == value
+                if np.ndim(mask) == 0:
+                    # NumPy returns a scalar when value is not comparable with the column
+                    mask = np.zeros(len(values), dtype=bool)
+                request.setFilterFids(fids[mask].tolist())
+            elif is_null:
+                request.setFilterExpression(
+                    QgsExpression.createFieldEqualityExpression(attribute, value)
+                )
+            else:
+                # The expression text is the same for every value; the value is
+                # bound as a static variable, which providers that compile
+                # expressions to SQL substitute as a literal
+                scope = QgsExpressionContextScope()
+                scope.setVariable("filter_value", value, True)
+                context = QgsExpressionContext(QgsExpressionContextUtils.globalProjectLayerScopes(layer))
+                context.appendScope(scope)
+                request.setFilterExpression(f"{QgsExpression.quotedColumnRef(attribute)} = @filter_value")
+                request.setExpressionContext(context)
+            if attributes is not None:
+                request.setSubsetOfAttributes(attributes, layer.fields())
+            if not with_geometry:
+                request.setFlags(QgsFeatureRequest.NoGeometry)
+
+            matching_features = list(layer.getFeatures(request))
 
             print(f"Found {len(matching_features)} features matching {attribute}={value}")
             return matching_features
@@ -287,10 +642,129 @@ class QGISProjectManager:
             print(f"Error filtering features: {e}")
             return []
 
-    def select_features(self, layer_name, feature_ids):
+    def spatial_join(self, target_layer_name, join_layer_name, predicate="intersects"):
+        """
+        Find pairs of features from two vector layers that satisfy a spatial predicate.
+
+        A spatial index is built on the smaller layer and probed with the
+        bounding box of each feature of the other layer. Only features of the
+        larger layer that fall within the combined extent of the indexed
+        features are fetched, and the exact predicate is only evaluated,
+        against a prepared geometry, for index candidates.
+
+        Args:
+            target_layer_name (str): Name of the target vector layer
+            join_layer_name (str): Name of the join vector layer
+            predicate (str): 'intersects', 'contains' or 'within', tested as target <predicate> join
+
+        Returns:
+            list: List of (target feature ID, join feature ID) tuples
+        """
+        try:
+            if predicate not in ("intersects", "contains", "within"):
+                print(f"Unsupported spatial predicate: {predicate}")
+                return []
+
+            target = self.get_layer_by_name(target_layer_name)
+            join = self.get_layer_by_name(join_layer_name)
+            if not isinstance(target, QgsVectorLayer) or not isinstance(join, QgsVectorLayer):
+                print("Invalid layer or not a vector layer")
+                return []
+
+            # Index the smaller layer and probe it with the larger one. When the
+            # target side is indexed, contains/within swap so the predicate still
+            # reads target <predicate> join.
+            swapped = target.featureCount() < join.featureCount()
+            if swapped:
+                indexed_layer, probe_layer = target, join
+                probe_predicate = {"contains": "within", "within": "contains"}.get(predicate, predicate)
+            else:
+                indexed_layer, probe_layer = join, target
+                probe_predicate = predicate
+
+            index = QgsSpatialIndex()
+            indexed_geometries = {}
+            indexed_extent = QgsRectangle()
+            indexed_extent.setMinimal()
+            for feature in indexed_layer.getFeatures(QgsFeatureRequest().setNoAttributes()):
+                if feature.hasGeometry():
+                    index.addFeature(feature)
+                    geometry = feature.geometry()
+                    indexed_geometries[feature.id()] = geometry
+                    indexed_extent.combineExtentWith(geometry.boundingBox())
+
+            pairs = []
+            if not indexed_geometries:
+                print(f"No features with geometry to join between {target_layer_name} and {join_layer_name}")
+                return pairs
+
+            # Only fetch probe features whose bounding box overlaps the indexed side.
+            # Probe geometries are reprojected to the indexed layer's CRS, which
+            # is also the CRS the filter rectangle is interpreted in.
+            probe_request = QgsFeatureRequest().setNoAttributes()
+            probe_request.setDestinationCrs(indexed_layer.crs(), self.project.transformContext())
+            probe_request.setFilterRect(indexed_extent)
+            for feature in probe_layer.getFeatures(probe_request):
+                if not feature.hasGeometry():
+                    continue
+                geometry = feature.geometry()
+                candidate_ids = index.intersects(geometry.boundingBox())
+                if not candidate_ids:
+                    continue
+
+                test = getattr(_prepared_engine(geometry), probe_predicate)
+                for candidate_id in candidate_ids:
+                    if test(indexed_geometries[candidate_id].constGet()):
+                        if swapped:
+                            pairs.append((candidate_id, feature.id()))
+                        else:
+                            pairs.append((feature.id(), candidate_id))
+
+            print(f"Found {len(pairs)} {predicate} matches between {target_layer_name} and {join_layer_name}")
+            return pairs
+        except Exception as e:
+            print(f"Error performing spatial join: {e}")
+            return []
+
+    @_requires_vector_layer([])
+    def contains_features(self, layer, geometry):
+        """
+        Get features of a vector layer that lie completely inside a geometry.
+
+        The provider only returns features whose bounding box intersects the
+        geometry; those are then tested against the prepared geometry, which
+        makes point-in-polygon lookups a GEOS tree search.
+
+        Args:
+            layer_name (str): Name of the vector layer
+            geometry (QgsGeometry): Containing geometry, in the layer CRS
+
+        Returns:
+            list: List of contained features
+        """
+        try:
+            engine = _prepared_engine(geometry)
+            request = QgsFeatureRequest().setFilterRect(geometry.boundingBox())
+            contained = [
+                feature
+                for feature in layer.getFeatures(request)
+                if feature.hasGeometry() and engine.contains(feature.geometry().constGet())
+            ]
+
+            print(f"Found {len(contained)} features contained in geometry in {layer.name()}")
+            return contained
+        except Exception as e:
+            print(f"Error finding contained features: {e}")
+            return []
+
+    @_requires_vector_layer(False)
+    def select_features(self, layer, feature_ids):
         """
         Select features by their IDs.
 
+        Duplicate IDs are dropped and the selection is replaced with a single
+        selectByIds call, which emits one selectionChanged signal.
+
         Args:
             layer_name (str): Name of the vector layer
             feature_ids (list): List of feature IDs to select
@@ -299,19 +773,53 @@ class QGISProjectManager:
             bool: True if successful, False otherwise
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:
-                print("Invalid layer or not a vector layer")
-                return False
+            selected = self._select_ids(layer, set(feature_ids))
+            print(f"Selected {selected} features in {layer.name()}")
+            return True
+        except Exception as e:
+            print(f"Error selecting features: {e}")
+            return False
+
+    @_requires_vector_layer(False)
+    def select_features_bulk(self, layer, id_batches):
+        """
+        Select the union of several batches of feature IDs in one operation.
+
+        Args:
+            layer_name (str): Name of the vector layer
+            id_batches (iterable): Iterable of feature ID lists
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            feature_ids = set()
+            for batch in id_batches:
+                feature_ids.update(batch)
 
-            layer.selectByIds(feature_ids)
-            print(f"Selected {len(feature_ids)} features in {layer_name}")
+            selected = self._select_ids(layer, feature_ids)
+            print(f"Selected {selected} features in {layer.name()}")
             return True
         except Exception as e:
             print(f"Error selecting features: {e}")
             return False
 
-    def clear_selection(self, layer_name):
+    def _select_ids(self, layer, feature_ids):
+        """
+        Replace the selection of a layer with a set of feature IDs.
+
+        Args:
+            layer (QgsVectorLayer): The vector layer
+            feature_ids (set): Feature IDs to select
+
+        Returns:
+            int: Number of selected IDs
+        """
+        layer.selectByIds(list(feature_ids), QgsVectorLayer.SetSelection)
+        return len(feature_ids)
+
+    @_requires_vector_layer(False)
+    def clear_selection(self, layer):
         """
         Clear selection in a vector layer.
 
@@ -322,13 +830,8 @@ class QGISProjectManager:
             bool: True if successful, False otherwise
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:
-                print("Invalid layer or not a vector layer")
-                return False
-
             layer.removeSelection()
-            print(f"Selection cleared in {layer_name}")
+            print(f"Selection cleared in {layer.name()}")
             return True
         except Exception as e:
             print(f"Error clearing selection: {e}")
@@ -357,26 +860,30 @@ class QGISProjectManager:
         """
         Get the extent (bounding box) of a layer.
 
+        The extent is computed once per layer and cached until the layer's
+        data changes, since some providers (e.g. delimited text) scan the
+        whole source to determine it.
+
         Args:
             layer_name (str): Name of the layer
 
         Returns:
-            dict: Dictionary with xmin, ymin, xmax, ymax
+            Extent: Named tuple with xmin, ymin, xmax, ymax
         """
         try:
             layer = self.get_layer_by_name(layer_name)
             if not layer:
                 return None
 
-            extent = layer.extent()
-            extent_dict = {
-                "xmin": extent.xMinimum(),
-                "ymin": extent.yMinimum(),
-                "xmax": extent.xMaximum(),
-                "ymax": extent.yMaximum(),
-            }
-            print(f"Layer extent: {extent_dict}")
-            return extent_dict
+            extent = self._extent_cache.get(layer.id())
+            if extent is None:
+                self._watch_layer(layer)
+                rect = layer.extent()
+                extent = Extent(rect.xMinimum(), rect.yMinimum(), rect.xMaximum(), rect.yMaximum())
+                self._extent_cache[layer.id()] = extent
+
+            print(f"Layer extent: {extent}")
+            return extent
         except Exception as e:
             print(f"Error retrieving extent: {e}")
             return None
@@ -409,47 +916,162 @@ class QGISProjectManager:
             print(f"Error setting layer visibility: {e}")
             return False
 
-    def export_vector_layer(self, layer_name, output_path, driver_name="ESRI Shapefile"):
+    @_requires_vector_layer(False)
+    def export_vector_layer(self, layer, output_path, driver_name="FlatGeobuf", where=None):
         """
         Export a vector layer to a file.
 
+        FlatGeobuf is the default format: it is written append-only with a
+        built-in spatial index and has none of Shapefile's 2 GB file size or
+        field name/width limits. Use driver_name="Parquet" (GDAL 3.5+) for
+        GeoParquet with WKB geometries, which DuckDB and GeoPandas read directly.
+
+        Large OGR-backed layers (see _GDAL_EXPORT_THRESHOLD) and filtered
+        exports are copied with gdal.VectorTranslate, which skips converting
+        every feature through QGIS.
+
         Args:
             layer_name (str): Name of the vector layer
             output_path (str): Path for the output file
             driver_name (str): OGR driver name
+            where (str): OGR SQL WHERE clause selecting the features to export.
+                Only supported for OGR-backed layers.
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            layer = self.get_layer_by_name(layer_name)
-            if not layer or layer.type() != 0:
-                print("Invalid layer or not a vector layer")
-                return False
-
-            error = QgsVectorFileWriter.writeAsVectorFormat(
-                layer, output_path, "utf-8", layer.crs(), driver_name
+            if where or layer.featureCount() >= _GDAL_EXPORT_THRESHOLD:
+                # GDAL reads the source file, so it would miss uncommitted edits
+                # and any field not stored in it (joined or expression fields)
+                fields = layer.fields()
+                provider_fields_only = all(
+                    fields.fieldOrigin(i) == QgsFields.OriginProvider for i in range(fields.count())
+                )
+                if (
+                    layer.providerType() == "ogr"
+                    and not layer.isEditable()
+                    and not layer.isModified()
+                    and provider_fields_only
+                ):
+                    return self._export_with_gdal(layer, output_path, driver_name, where)
+                if where:
+                    print("Filtered export requires an unedited OGR-backed layer with only provider fields")
+                    return False
+
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = driver_name
+            options.fileEncoding = "utf-8"
+            options.layerOptions = _EXPORT_LAYER_OPTIONS.get(driver_name, [])
+
+            error, message, _, _ = QgsVectorFileWriter.writeAsVectorFormatV3(
+                layer, output_path, self.project.transformContext(), options
             )
 
             if error == QgsVectorFileWriter.NoError:
                 print(f"Layer exported to: {output_path}")
                 return True
             else:
-                print(f"Export failed with error code: {error}")
+                print(f"Export failed with error code {error}: {message}")
                 return False
         except Exception as e:
             print(f"Error exporting layer: {e}")
             return False
 
+    def _export_with_gdal(self, layer, output_path, driver_name, where=None):
+        """
+        Export an OGR-backed layer with gdal.VectorTranslate.
+
+        Args:
+            layer (QgsVectorLayer): Layer using the 'ogr' provider
+            output_path (str): Path for the output file
+            driver_name (str): OGR driver name
+            where (str): Optional OGR SQL WHERE clause, combined with the layer's subset string
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        from osgeo import gdal
+
+        parts = QgsProviderRegistry.instance().decodeUri("ogr", layer.source())
+        source = gdal.OpenEx(parts["path"], gdal.OF_VECTOR)
+        if source is None:
+            print(f"GDAL could not open layer source: {parts['path']}")
+            return False
+
+        # Name the source layer explicitly; without it GDAL copies every layer
+        # of the dataset. QGIS opens the first layer when the URI has neither.
+        layer_name = parts.get("layerName")
+        if not layer_name:
+            source_layer = source.GetLayer(int(parts.get("layerId") or 0))
+            if source_layer is None:
+                print(f"GDAL could not find the layer in: {parts['path']}")
+                return False
+            layer_name = source_layer.GetName()
+
+        filters = [f"({clause})" for clause in (layer.subsetString(), where) if clause]
+        options = gdal.VectorTranslateOptions(
+            format=driver_name,
+            accessMode="overwrite",
+            layers=[layer_name],
+            where=" AND ".join(filters) or None,
+            layerCreationOptions=_EXPORT_LAYER_OPTIONS.get(driver_name, []),
+        )
+        result = gdal.VectorTranslate(output_path, source, options=options)
+        if result is None:
+            print(f"GDAL export failed: {gdal.GetLastErrorMsg()}")
+            return False
+
+        # Dropping the dataset reference flushes and closes the output
+        result = None
+        print(f"Layer exported to: {output_path}")
+        return True
+
+    @_requires_vector_layer(False)
+    def add_features_bulk(self, layer, features):
+        """
+        Add many features to a vector layer in a single edit session.
+
+        All features go into the edit buffer with one addFeatures call and
+        are written with one commit. If the layer is already being edited,
+        the features are added but committing is left to the caller.
+
+        Args:
+            layer_name (str): Name of the vector layer
+            features (list): QgsFeature objects to add
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            features = list(features)
+            if layer.isEditable():
+                success = layer.addFeatures(features)
+            else:
+                if not layer.startEditing():
+                    print(f"Layer cannot be edited: {layer.name()}")
+                    return False
+                success = layer.addFeatures(features) and layer.commitChanges()
+                if not success:
+                    print(f"Commit errors: {layer.commitErrors()}")
+                    layer.rollBack()
+
+            if success:
+                print(f"Added {len(features)} features to {layer.name()}")
+            else:
+                print(f"Failed to add features to {layer.name()}")
+            return success
+        except Exception as e:
+            print(f"Error adding features: {e}")
+            return False
+
 
 def example_usage():
     """Example usage of the QGISProjectManager class."""
     print("=== PyQGIS Example: Layer Operations and Project Handling ===\n")
 
     # Initialize QGIS Application (required for non-GUI usage)
-    if not QgsApplication.instance():
-        qgs = QgsApplication([], False)
-        qgs.initQgis()
+    _ensure_qgis()
 
     # Create project manager
     manager = QGISProjectManager()
@@ -461,7 +1083,7 @@ def example_usage():
 
     # Example: List all layers
     print("\n--- Listing Layers ---")
-    manager.list_layers()
+    manager.list_layers(verbose=True)
 
     # Example: Layer operations
     print("\n--- Layer Operations ---")
@@ -473,9 +1095,12 @@ def example_usage():
     # Example: Working with features
     print("\n--- Feature Operations ---")
     # features = manager.get_layer_features('My Shapefile', limit=10)
+    # features = manager.get_layer_features('My Shapefile', workers=os.cpu_count())
+    # values = manager.get_attribute_array('My Shapefile', 'field_name')
     # filtered = manager.filter_features('My Shapefile', 'field_name', 'value')
     # manager.select_features('My Shapefile', [1, 2, 3])
     # manager.clear_selection('My Shapefile')
+    # pairs = manager.spatial_join('My Shapefile', 'Other Layer', 'intersects')
 
     # Example: Project operations
     print("\n--- Project Operations ---")